@@ -1,6 +1,5 @@
 import discord
 from discord.ext import commands
-import os
 from config import BOT_TOKEN
 
 intents = discord.Intents.default()
@@ -2,6 +2,8 @@ from dataclasses import dataclass
 
 @dataclass
 class ParsedSlip:
+    __slots__ = ("bookmaker", "event", "odds", "stake", "legs")
+
     bookmaker: str
     event: str
     odds: str
@@ -1,8 +1,10 @@
+from collections import defaultdict
+
 # Later: replace with proper DB ORM (SQLAlchemy)
-bets = []
+bets = defaultdict(list)
 
 def add_bet(user_id, parsed_slip):
-    bets.append({"user": user_id, "slip": parsed_slip})
+    bets[user_id].append({"user": user_id, "slip": parsed_slip})
 
 def list_bets(user_id):
-    return [b for b in bets if b["user"] == user_id]
+    return list(bets.get(user_id, ()))